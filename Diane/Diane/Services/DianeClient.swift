@@ -34,7 +34,18 @@ private func makeGoCompatibleDecoder() -> JSONDecoder {
 class DianeClient: DianeClientProtocol {
     /// Shared singleton instance
     static let shared = DianeClient()
-    
+
+    /// Shared coders — building JSONEncoder/JSONDecoder per request is wasted
+    /// allocation on the hot path, so create them once and reuse
+    private static let jsonEncoder = JSONEncoder()
+    private static let jsonDecoder = JSONDecoder()
+    private static let goDecoder = makeGoCompatibleDecoder()
+
+    /// CharacterSet.urlPathAllowed/.urlQueryAllowed are computed properties
+    /// that can construct a bridged NSCharacterSet on each access; cache them
+    private static let pathAllowed: CharacterSet = .urlPathAllowed
+    private static let queryAllowed: CharacterSet = .urlQueryAllowed
+
     private let socketPath: String
     private let session: URLSession
     
@@ -299,7 +310,7 @@ class DianeClient: DianeClientProtocol {
         let data = try await request("/status")
         
         do {
-            let status = try makeGoCompatibleDecoder().decode(DianeStatus.self, from: data)
+            let status = try Self.goDecoder.decode(DianeStatus.self, from: data)
             logger.info("Status decoded successfully: running=\(status.running), version=\(status.version)")
             FileLogger.shared.info("Status decoded successfully: running=\(status.running), version=\(status.version)", category: "DianeClient")
             return status
@@ -314,37 +325,37 @@ class DianeClient: DianeClientProtocol {
     /// Get MCP servers
     func getMCPServers() async throws -> [MCPServerStatus] {
         let data = try await request("/mcp-servers")
-        return try JSONDecoder().decode([MCPServerStatus].self, from: data)
+        return try Self.jsonDecoder.decode([MCPServerStatus].self, from: data)
     }
     
     /// Get all tools
     func getTools() async throws -> [ToolInfo] {
         let data = try await request("/tools")
-        return try JSONDecoder().decode([ToolInfo].self, from: data)
+        return try Self.jsonDecoder.decode([ToolInfo].self, from: data)
     }
     
     func getPrompts() async throws -> [PromptInfo] {
         let data = try await request("/prompts")
-        return try JSONDecoder().decode([PromptInfo].self, from: data)
+        return try Self.jsonDecoder.decode([PromptInfo].self, from: data)
     }
     
     func getResources() async throws -> [ResourceInfo] {
         let data = try await request("/resources")
-        return try JSONDecoder().decode([ResourceInfo].self, from: data)
+        return try Self.jsonDecoder.decode([ResourceInfo].self, from: data)
     }
     
     func getPromptContent(server: String, name: String) async throws -> PromptContentResponse {
-        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? server
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? name
+        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? server
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? name
         let data = try await request("/prompts/get?server=\(encodedServer)&name=\(encodedName)")
-        return try JSONDecoder().decode(PromptContentResponse.self, from: data)
+        return try Self.jsonDecoder.decode(PromptContentResponse.self, from: data)
     }
     
     func getResourceContent(server: String, uri: String) async throws -> ResourceContentResponse {
-        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? server
-        let encodedURI = uri.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? uri
+        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? server
+        let encodedURI = uri.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? uri
         let data = try await request("/resources/read?server=\(encodedServer)&uri=\(encodedURI)")
-        return try JSONDecoder().decode(ResourceContentResponse.self, from: data)
+        return try Self.jsonDecoder.decode(ResourceContentResponse.self, from: data)
     }
     
     /// Reload configuration
@@ -361,16 +372,24 @@ class DianeClient: DianeClientProtocol {
     
     /// Start OAuth login for an MCP server (device flow)
     func startAuth(serverName: String) async throws -> DeviceCodeInfo {
-        let encodedName = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
+        let encodedName = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
         let data = try await request("/auth/\(encodedName)/login", method: "POST", timeout: 10)
-        return try JSONDecoder().decode(DeviceCodeInfo.self, from: data)
+        return try Self.jsonDecoder.decode(DeviceCodeInfo.self, from: data)
     }
     
     /// Poll for OAuth token completion
     func pollAuth(serverName: String, deviceCode: String, interval: Int) async throws {
-        let encodedName = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
-        let body: [String: Any] = ["device_code": deviceCode, "interval": interval]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let encodedName = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
+        struct Body: Encodable {
+            let deviceCode: String
+            let interval: Int
+
+            enum CodingKeys: String, CodingKey {
+                case deviceCode = "device_code"
+                case interval
+            }
+        }
+        let bodyData = try Self.jsonEncoder.encode(Body(deviceCode: deviceCode, interval: interval))
         _ = try await request("/auth/\(encodedName)/poll", method: "POST", timeout: 120, body: bodyData)
     }
     
@@ -379,7 +398,7 @@ class DianeClient: DianeClientProtocol {
     /// Get all scheduled jobs
     func getJobs() async throws -> [Job] {
         let data = try await request("/jobs")
-        return try makeGoCompatibleDecoder().decode([Job].self, from: data)
+        return try Self.goDecoder.decode([Job].self, from: data)
     }
     
     /// Get job execution logs
@@ -389,13 +408,13 @@ class DianeClient: DianeClientProtocol {
             path += "&job_name=\(jobName)"
         }
         let data = try await request(path)
-        return try makeGoCompatibleDecoder().decode([JobExecution].self, from: data)
+        return try Self.goDecoder.decode([JobExecution].self, from: data)
     }
     
     /// Toggle a job's enabled status
     func toggleJob(name: String, enabled: Bool) async throws {
         let body = ["enabled": enabled]
-        let bodyData = try JSONEncoder().encode(body)
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await request("/jobs/\(name)/toggle", method: "POST", body: bodyData)
     }
     
@@ -404,14 +423,14 @@ class DianeClient: DianeClientProtocol {
     /// Fetch pending agent questions from the Emergent backend (via daemon).
     func fetchPendingQuestions() async throws -> [AgentQuestion] {
         let data = try await request("/questions?status=pending")
-        return try makeGoCompatibleDecoder().decode([AgentQuestion].self, from: data)
+        return try Self.goDecoder.decode([AgentQuestion].self, from: data)
     }
     
     /// Submit an answer for a pending agent question.
     /// Throws if the question is not found, already answered, or the request fails.
     func respondToQuestion(id: String, response: String) async throws {
         struct Body: Encodable { let response: String }
-        let bodyData = try JSONEncoder().encode(Body(response: response))
+        let bodyData = try Self.jsonEncoder.encode(Body(response: response))
         let data = try await request("/questions/\(id)/respond", method: "POST", timeout: 10, body: bodyData)
         // The daemon returns 202 with {"status":"ok"}; any error throws from request().
         _ = data
@@ -474,139 +493,135 @@ class DianeClient: DianeClientProtocol {
     }
     
     // MARK: - Agents API
-    
+
+    /// Build a percent-encoded /agents/... path. URLComponents uses
+    /// CoreFoundation's encoder and gives one consistent escape policy instead
+    /// of a per-call addingPercentEncoding whose `?? name` fallback could emit
+    /// an unencoded path.
+    private static func agentPath(_ name: String, suffix: String = "") -> String {
+        var components = URLComponents()
+        components.path = "/agents/\(name)\(suffix)"
+        return components.percentEncodedPath
+    }
+
     /// Get all configured agents
     func getAgents() async throws -> [AgentConfig] {
         let data = try await request("/agents")
-        return try JSONDecoder().decode([AgentConfig].self, from: data)
+        return try Self.jsonDecoder.decode([AgentConfig].self, from: data)
     }
     
     /// Get a specific agent by name
     func getAgent(name: String) async throws -> AgentConfig {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        let data = try await request("/agents/\(encodedName)")
-        return try JSONDecoder().decode(AgentConfig.self, from: data)
+        let data = try await request(Self.agentPath(name))
+        return try Self.jsonDecoder.decode(AgentConfig.self, from: data)
     }
     
     /// Test an agent's connectivity
     func testAgent(name: String) async throws -> AgentTestResult {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        let data = try await request("/agents/\(encodedName)/test", method: "POST", timeout: 10)
-        return try JSONDecoder().decode(AgentTestResult.self, from: data)
+        let data = try await request(Self.agentPath(name, suffix: "/test"), method: "POST", timeout: 10)
+        return try Self.jsonDecoder.decode(AgentTestResult.self, from: data)
     }
     
     /// Toggle an agent's enabled status
     func toggleAgent(name: String, enabled: Bool) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
         let body = ["enabled": enabled]
-        let bodyData = try JSONEncoder().encode(body)
-        _ = try await request("/agents/\(encodedName)/toggle", method: "POST", body: bodyData)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        _ = try await request(Self.agentPath(name, suffix: "/toggle"), method: "POST", body: bodyData)
     }
     
     /// Run a prompt on an agent
     func runAgentPrompt(agentName: String, prompt: String, remoteAgentName: String? = nil) async throws -> AgentRunResult {
-        let encodedName = agentName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentName
         var body: [String: String] = ["prompt": prompt]
         if let remoteAgent = remoteAgentName {
             body["agent_name"] = remoteAgent
         }
-        let bodyData = try JSONEncoder().encode(body)
-        let data = try await request("/agents/\(encodedName)/run", method: "POST", timeout: 60, body: bodyData)
-        return try makeGoCompatibleDecoder().decode(AgentRunResult.self, from: data)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        let data = try await request(Self.agentPath(agentName, suffix: "/run"), method: "POST", timeout: 60, body: bodyData)
+        return try Self.goDecoder.decode(AgentRunResult.self, from: data)
     }
     
     /// Get agent communication logs
     func getAgentLogs(agentName: String? = nil, limit: Int = 50) async throws -> [AgentLog] {
         var path = "/agents/logs?limit=\(limit)"
         if let agentName = agentName {
-            let encodedName = agentName.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? agentName
+            let encodedName = agentName.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? agentName
             path += "&agent_name=\(encodedName)"
         }
         let data = try await request(path)
-        return try makeGoCompatibleDecoder().decode([AgentLog].self, from: data)
+        return try Self.goDecoder.decode([AgentLog].self, from: data)
     }
     
     /// Remove an agent
     func removeAgent(name: String) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        _ = try await request("/agents/\(encodedName)", method: "DELETE")
+        _ = try await request(Self.agentPath(name), method: "DELETE")
     }
     
     /// Get remote sub-agents/config options from an ACP agent
     func getRemoteAgents(agentName: String) async throws -> [RemoteAgentInfo] {
-        let encodedName = agentName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentName
-        let data = try await request("/agents/\(encodedName)/remote-agents", method: "GET", timeout: 35)
-        return try JSONDecoder().decode([RemoteAgentInfo].self, from: data)
+        let data = try await request(Self.agentPath(agentName, suffix: "/remote-agents"), method: "GET", timeout: 35)
+        return try Self.jsonDecoder.decode([RemoteAgentInfo].self, from: data)
     }
     
     /// Update an agent's configuration
     func updateAgent(name: String, subAgent: String? = nil, enabled: Bool? = nil, description: String? = nil, workdir: String? = nil) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        var body: [String: Any] = [:]
-        if let subAgent = subAgent {
-            body["sub_agent"] = subAgent
-        }
-        if let enabled = enabled {
-            body["enabled"] = enabled
-        }
-        if let description = description {
-            body["description"] = description
-        }
-        if let workdir = workdir {
-            body["workdir"] = workdir
+        struct Body: Encodable {
+            let subAgent: String?
+            let enabled: Bool?
+            let description: String?
+            let workdir: String?
+
+            enum CodingKeys: String, CodingKey {
+                case subAgent = "sub_agent"
+                case enabled, description, workdir
+            }
         }
-        
-        guard !body.isEmpty else { return }
-        
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
-        _ = try await request("/agents/\(encodedName)/update", method: "POST", body: bodyData)
+
+        // Nothing to update — keep the old no-op behavior
+        guard subAgent != nil || enabled != nil || description != nil || workdir != nil else { return }
+
+        let body = Body(subAgent: subAgent, enabled: enabled, description: description, workdir: workdir)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        _ = try await request(Self.agentPath(name, suffix: "/update"), method: "POST", body: bodyData)
     }
     
 
     func addAgent(agent: AgentConfig) async throws {
-        let bodyData = try JSONEncoder().encode(agent)
+        let bodyData = try Self.jsonEncoder.encode(agent)
         _ = try await request("/agents", method: "POST", timeout: 10, body: bodyData)
     }
 
     // MARK: - Cloud Agent Methods
     
     func triggerRun(agentId: String) async throws -> EmergentTriggerResponseDTO {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let data = try await request("/agents/\(encodedId)/trigger", method: "POST", timeout: 30)
-        return try makeGoCompatibleDecoder().decode(EmergentTriggerResponseDTO.self, from: data)
+        let data = try await request(Self.agentPath(agentId, suffix: "/trigger"), method: "POST", timeout: 30)
+        return try Self.goDecoder.decode(EmergentTriggerResponseDTO.self, from: data)
     }
 
     func getAgentRuns(agentId: String, limit: Int = 10) async throws -> [EmergentAgentRunDTO] {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let data = try await request("/agents/\(encodedId)/runs?limit=\(limit)", method: "GET", timeout: 30)
-        return try makeGoCompatibleDecoder().decode([EmergentAgentRunDTO].self, from: data)
+        let data = try await request(Self.agentPath(agentId, suffix: "/runs") + "?limit=\(limit)", method: "GET", timeout: 30)
+        return try Self.goDecoder.decode([EmergentAgentRunDTO].self, from: data)
     }
 
     func cancelRun(agentId: String, runId: String) async throws {
-        let encodedAgent = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let encodedRun = runId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? runId
-        _ = try await request("/agents/\(encodedAgent)/runs/\(encodedRun)/cancel", method: "POST", timeout: 15)
+        _ = try await request(Self.agentPath(agentId, suffix: "/runs/\(runId)/cancel"), method: "POST", timeout: 15)
     }
 
     func getPendingEvents(agentId: String, limit: Int = 100) async throws -> EmergentPendingEventsResponseDTO {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let data = try await request("/agents/\(encodedId)/pending-events?limit=\(limit)", method: "GET", timeout: 30)
-        return try makeGoCompatibleDecoder().decode(EmergentPendingEventsResponseDTO.self, from: data)
+        let data = try await request(Self.agentPath(agentId, suffix: "/pending-events") + "?limit=\(limit)", method: "GET", timeout: 30)
+        return try Self.goDecoder.decode(EmergentPendingEventsResponseDTO.self, from: data)
     }
 
     func batchTrigger(agentId: String, objectIds: [String]) async throws -> EmergentBatchTriggerResponseDTO {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
         let body = ["objectIds": objectIds]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
-        let data = try await request("/agents/\(encodedId)/batch-trigger", method: "POST", timeout: 30, body: bodyData)
-        return try makeGoCompatibleDecoder().decode(EmergentBatchTriggerResponseDTO.self, from: data)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        let data = try await request(Self.agentPath(agentId, suffix: "/batch-trigger"), method: "POST", timeout: 30, body: bodyData)
+        return try Self.goDecoder.decode(EmergentBatchTriggerResponseDTO.self, from: data)
     }
 
     func updateCloudAgent(agentId: String, update: EmergentAgentUpdateDTO) async throws -> EmergentAgentDTO {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let bodyData = try JSONEncoder().encode(update)
-        let data = try await request("/agents/\(encodedId)", method: "PATCH", timeout: 30, body: bodyData)
-        return try makeGoCompatibleDecoder().decode(EmergentAgentDTO.self, from: data)
+        let bodyData = try Self.jsonEncoder.encode(update)
+        let data = try await request(Self.agentPath(agentId), method: "PATCH", timeout: 30, body: bodyData)
+        return try Self.goDecoder.decode(EmergentAgentDTO.self, from: data)
     }
 
     // MARK: - Gallery API
@@ -615,26 +630,24 @@ class DianeClient: DianeClientProtocol {
     func getGallery(featured: Bool = false) async throws -> [GalleryEntry] {
         let path = featured ? "/gallery?featured=true" : "/gallery"
         let data = try await request(path)
-        return try JSONDecoder().decode([GalleryEntry].self, from: data)
+        return try Self.jsonDecoder.decode([GalleryEntry].self, from: data)
     }
     
     /// Install an agent from the gallery
     func installGalleryAgent(id: String, name: String? = nil, workdir: String? = nil, port: Int? = nil) async throws -> GalleryInstallResponse {
-        var body: [String: Any] = [:]
-        if let name = name {
-            body["name"] = name
-        }
-        if let workdir = workdir {
-            body["workdir"] = workdir
-        }
-        if let port = port, port > 0 {
-            body["port"] = port
-            body["type"] = "acp"
+        struct Body: Encodable {
+            let name: String?
+            let workdir: String?
+            let port: Int?
+            let type: String?
         }
-        
-        let bodyData = body.isEmpty ? nil : try JSONSerialization.data(withJSONObject: body)
+
+        // A positive port means an ACP install; otherwise port/type are omitted
+        let wantsACP = (port ?? 0) > 0
+        let body = Body(name: name, workdir: workdir, port: wantsACP ? port : nil, type: wantsACP ? "acp" : nil)
+        let bodyData = (name == nil && workdir == nil && !wantsACP) ? nil : try Self.jsonEncoder.encode(body)
         let data = try await request("/gallery/\(id)/install", method: "POST", body: bodyData)
-        return try JSONDecoder().decode(GalleryInstallResponse.self, from: data)
+        return try Self.jsonDecoder.decode(GalleryInstallResponse.self, from: data)
     }
     
     // MARK: - Contexts API
@@ -642,14 +655,14 @@ class DianeClient: DianeClientProtocol {
     /// Get all contexts
     func getContexts() async throws -> [Context] {
         let data = try await request("/contexts")
-        return try JSONDecoder().decode([Context].self, from: data)
+        return try Self.jsonDecoder.decode([Context].self, from: data)
     }
     
     /// Get context details including servers and tools
     func getContextDetail(name: String) async throws -> ContextDetail {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? name
         let data = try await request("/contexts/\(encodedName)")
-        return try JSONDecoder().decode(ContextDetail.self, from: data)
+        return try Self.jsonDecoder.decode(ContextDetail.self, from: data)
     }
     
     /// Create a new context
@@ -658,109 +671,115 @@ class DianeClient: DianeClientProtocol {
         if let description = description {
             body["description"] = description
         }
-        let bodyData = try JSONEncoder().encode(body)
+        let bodyData = try Self.jsonEncoder.encode(body)
         let data = try await request("/contexts", method: "POST", body: bodyData)
-        return try JSONDecoder().decode(Context.self, from: data)
+        return try Self.jsonDecoder.decode(Context.self, from: data)
     }
     
     /// Update a context's description
     func updateContext(name: String, description: String) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? name
         let body = ["description": description]
-        let bodyData = try JSONEncoder().encode(body)
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await request("/contexts/\(encodedName)", method: "PUT", body: bodyData)
     }
     
     /// Delete a context
     func deleteContext(name: String) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? name
         _ = try await request("/contexts/\(encodedName)", method: "DELETE")
     }
     
     /// Set a context as the default
     func setDefaultContext(name: String) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? name
         _ = try await request("/contexts/\(encodedName)/default", method: "POST")
     }
     
     /// Get connection info for a context
     func getContextConnectInfo(name: String) async throws -> ContextConnectInfo {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? name
         let data = try await request("/contexts/\(encodedName)/connect")
-        return try JSONDecoder().decode(ContextConnectInfo.self, from: data)
+        return try Self.jsonDecoder.decode(ContextConnectInfo.self, from: data)
     }
     
     /// Get servers in a context
     func getContextServers(contextName: String) async throws -> [ContextServer] {
-        let encodedName = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
+        let encodedName = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
         let data = try await request("/contexts/\(encodedName)/servers")
-        return try JSONDecoder().decode([ContextServer].self, from: data)
+        return try Self.jsonDecoder.decode([ContextServer].self, from: data)
     }
     
     /// Enable/disable a server in a context
     func setServerEnabledInContext(contextName: String, serverName: String, enabled: Bool) async throws {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
-        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
+        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
         let body = ["enabled": enabled]
-        let bodyData = try JSONEncoder().encode(body)
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await request("/contexts/\(encodedContext)/servers/\(encodedServer)", method: "PUT", body: bodyData)
     }
     
     /// Remove a server from a context
     func removeServerFromContext(contextName: String, serverName: String) async throws {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
-        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
+        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
         _ = try await request("/contexts/\(encodedContext)/servers/\(encodedServer)", method: "DELETE")
     }
     
     /// Get tools for a server in a context
     func getContextServerTools(contextName: String, serverName: String) async throws -> [ContextTool] {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
-        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
+        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
         let data = try await request("/contexts/\(encodedContext)/servers/\(encodedServer)/tools")
-        return try JSONDecoder().decode([ContextTool].self, from: data)
+        return try Self.jsonDecoder.decode([ContextTool].self, from: data)
     }
     
     /// Enable/disable a specific tool in a context
     func setToolEnabledInContext(contextName: String, serverName: String, toolName: String, enabled: Bool) async throws {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
-        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
-        let encodedTool = toolName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? toolName
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
+        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
+        let encodedTool = toolName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? toolName
         let body = ["enabled": enabled]
-        let bodyData = try JSONEncoder().encode(body)
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await request("/contexts/\(encodedContext)/servers/\(encodedServer)/tools/\(encodedTool)", method: "PUT", body: bodyData)
     }
     
     /// Bulk update tool enabled states
     func bulkSetToolsEnabled(contextName: String, serverName: String, tools: [String: Bool]) async throws {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
-        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
-        let bodyData = try JSONEncoder().encode(tools)
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
+        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
+        let bodyData = try Self.jsonEncoder.encode(tools)
         _ = try await request("/contexts/\(encodedContext)/servers/\(encodedServer)/tools", method: "PUT", body: bodyData)
     }
     
     /// Sync tools from running MCP servers to a context
     func syncContextTools(contextName: String) async throws -> Int {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
         let data = try await request("/contexts/\(encodedContext)/sync", method: "POST")
-        let decoder = makeGoCompatibleDecoder()
-        let result = try decoder.decode(SyncResult.self, from: data)
+        let result = try Self.goDecoder.decode(SyncResult.self, from: data)
         return result.toolsSynced
     }
     
     /// Get available servers that can be added to a context
     func getAvailableServers(contextName: String) async throws -> [AvailableServer] {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
         let data = try await request("/contexts/\(encodedContext)/available-servers")
-        let decoder = makeGoCompatibleDecoder()
-        return try decoder.decode([AvailableServer].self, from: data)
+        return try Self.goDecoder.decode([AvailableServer].self, from: data)
     }
     
     /// Add a server to a context
     func addServerToContext(contextName: String, serverName: String, enabled: Bool = true) async throws {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
-        let body: [String: Any] = ["server_name": serverName, "enabled": enabled]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
+        struct Body: Encodable {
+            let serverName: String
+            let enabled: Bool
+
+            enum CodingKeys: String, CodingKey {
+                case serverName = "server_name"
+                case enabled
+            }
+        }
+        let bodyData = try Self.jsonEncoder.encode(Body(serverName: serverName, enabled: enabled))
         _ = try await request("/contexts/\(encodedContext)/servers", method: "POST", body: bodyData)
     }
     
@@ -769,13 +788,13 @@ class DianeClient: DianeClientProtocol {
     /// Get all MCP server configurations
     func getMCPServerConfigs() async throws -> [MCPServer] {
         let data = try await request("/mcp-servers-config")
-        return try makeGoCompatibleDecoder().decode([MCPServer].self, from: data)
+        return try Self.goDecoder.decode([MCPServer].self, from: data)
     }
     
     /// Get a specific MCP server configuration by ID
     func getMCPServerConfig(id: Int64) async throws -> MCPServer {
         let data = try await request("/mcp-servers-config/\(id)")
-        return try makeGoCompatibleDecoder().decode(MCPServer.self, from: data)
+        return try Self.goDecoder.decode(MCPServer.self, from: data)
     }
     
     /// Create a new MCP server configuration
@@ -801,7 +820,7 @@ class DianeClient: DianeClientProtocol {
             body["headers"] = headers
         }
         if let oauth = oauth {
-            body["oauth"] = try? JSONEncoder().encode(oauth)
+            body["oauth"] = try? Self.jsonEncoder.encode(oauth)
         }
         if let nodeID = nodeID {
             body["node_id"] = nodeID
@@ -812,7 +831,7 @@ class DianeClient: DianeClientProtocol {
         
         let bodyData = try JSONSerialization.data(withJSONObject: body)
         let data = try await request("/mcp-servers-config", method: "POST", body: bodyData)
-        return try makeGoCompatibleDecoder().decode(MCPServer.self, from: data)
+        return try Self.goDecoder.decode(MCPServer.self, from: data)
     }
     
     /// Update an MCP server configuration
@@ -843,7 +862,7 @@ class DianeClient: DianeClientProtocol {
             body["headers"] = headers
         }
         if let oauth = oauth {
-            body["oauth"] = try? JSONEncoder().encode(oauth)
+            body["oauth"] = try? Self.jsonEncoder.encode(oauth)
         }
         if let nodeID = nodeID {
             body["node_id"] = nodeID
@@ -859,7 +878,7 @@ class DianeClient: DianeClientProtocol {
         
         let bodyData = try JSONSerialization.data(withJSONObject: body)
         let data = try await request("/mcp-servers-config/\(id)", method: "PUT", body: bodyData)
-        return try makeGoCompatibleDecoder().decode(MCPServer.self, from: data)
+        return try Self.goDecoder.decode(MCPServer.self, from: data)
     }
     
     /// Delete an MCP server configuration
@@ -872,15 +891,15 @@ class DianeClient: DianeClientProtocol {
     /// Get all placements for a specific host
     func getPlacements(hostID: String) async throws -> [MCPServerPlacement] {
         let data = try await request("/mcp-placements?host_id=\(hostID)")
-        return try makeGoCompatibleDecoder().decode([MCPServerPlacement].self, from: data)
+        return try Self.goDecoder.decode([MCPServerPlacement].self, from: data)
     }
     
     /// Update a placement's enabled state
     func updatePlacement(serverID: Int64, hostID: String, enabled: Bool) async throws -> MCPServerPlacement {
         let body = UpdatePlacementRequest(enabled: enabled)
-        let bodyData = try JSONEncoder().encode(body)
+        let bodyData = try Self.jsonEncoder.encode(body)
         let data = try await request("/mcp-placements/\(serverID)/\(hostID)", method: "PUT", body: bodyData)
-        return try makeGoCompatibleDecoder().decode(MCPServerPlacement.self, from: data)
+        return try Self.goDecoder.decode(MCPServerPlacement.self, from: data)
     }
     
     /// Delete a placement
@@ -893,7 +912,7 @@ class DianeClient: DianeClientProtocol {
     /// Get all hosts (master + slaves)
     func getHosts() async throws -> [HostInfo] {
         let data = try await request("/hosts")
-        return try makeGoCompatibleDecoder().decode([HostInfo].self, from: data)
+        return try Self.goDecoder.decode([HostInfo].self, from: data)
     }
     
     // MARK: - Providers API
@@ -905,19 +924,19 @@ class DianeClient: DianeClientProtocol {
             path += "?type=\(type.rawValue)"
         }
         let data = try await request(path)
-        return try makeGoCompatibleDecoder().decode([Provider].self, from: data)
+        return try Self.goDecoder.decode([Provider].self, from: data)
     }
     
     /// Get provider templates
     func getProviderTemplates() async throws -> [ProviderTemplate] {
         let data = try await request("/providers/templates")
-        return try JSONDecoder().decode([ProviderTemplate].self, from: data)
+        return try Self.jsonDecoder.decode([ProviderTemplate].self, from: data)
     }
     
     /// Get a specific provider by ID
     func getProvider(id: Int64) async throws -> Provider {
         let data = try await request("/providers/\(id)")
-        return try makeGoCompatibleDecoder().decode(Provider.self, from: data)
+        return try Self.goDecoder.decode(Provider.self, from: data)
     }
     
     /// Create a new provider
@@ -932,7 +951,7 @@ class DianeClient: DianeClientProtocol {
         }
         let bodyData = try JSONSerialization.data(withJSONObject: body)
         let data = try await request("/providers", method: "POST", body: bodyData)
-        return try makeGoCompatibleDecoder().decode(Provider.self, from: data)
+        return try Self.goDecoder.decode(Provider.self, from: data)
     }
     
     /// Update a provider
@@ -955,7 +974,7 @@ class DianeClient: DianeClientProtocol {
         
         let bodyData = try JSONSerialization.data(withJSONObject: body)
         let data = try await request("/providers/\(id)", method: "PUT", body: bodyData)
-        return try makeGoCompatibleDecoder().decode(Provider.self, from: data)
+        return try Self.goDecoder.decode(Provider.self, from: data)
     }
     
     /// Delete a provider
@@ -966,25 +985,25 @@ class DianeClient: DianeClientProtocol {
     /// Enable a provider
     func enableProvider(id: Int64) async throws -> Provider {
         let data = try await request("/providers/\(id)/enable", method: "POST")
-        return try makeGoCompatibleDecoder().decode(Provider.self, from: data)
+        return try Self.goDecoder.decode(Provider.self, from: data)
     }
     
     /// Disable a provider
     func disableProvider(id: Int64) async throws -> Provider {
         let data = try await request("/providers/\(id)/disable", method: "POST")
-        return try makeGoCompatibleDecoder().decode(Provider.self, from: data)
+        return try Self.goDecoder.decode(Provider.self, from: data)
     }
     
     /// Set a provider as the default for its type
     func setDefaultProvider(id: Int64) async throws -> Provider {
         let data = try await request("/providers/\(id)/set-default", method: "POST")
-        return try makeGoCompatibleDecoder().decode(Provider.self, from: data)
+        return try Self.goDecoder.decode(Provider.self, from: data)
     }
     
     /// Test a provider's connectivity
     func testProvider(id: Int64) async throws -> ProviderTestResult {
         let data = try await request("/providers/\(id)/test", method: "POST", timeout: 35)
-        return try makeGoCompatibleDecoder().decode(ProviderTestResult.self, from: data)
+        return try Self.goDecoder.decode(ProviderTestResult.self, from: data)
     }
     
     /// List available models for a service
@@ -995,14 +1014,14 @@ class DianeClient: DianeClientProtocol {
         }
         let bodyData = try JSONSerialization.data(withJSONObject: requestBody)
         let data = try await request("/providers/models", method: "POST", timeout: 35, body: bodyData)
-        let response = try makeGoCompatibleDecoder().decode(ListModelsResponse.self, from: data)
+        let response = try Self.goDecoder.decode(ListModelsResponse.self, from: data)
         return response.models
     }
     
     /// Get model info by provider and model ID (e.g., "google-vertex", "gemini-2.0-flash")
     func getModelInfo(provider: String, modelID: String) async throws -> AvailableModel {
         let data = try await request("/models/\(provider)/\(modelID)")
-        return try makeGoCompatibleDecoder().decode(AvailableModel.self, from: data)
+        return try Self.goDecoder.decode(AvailableModel.self, from: data)
     }
     
     // MARK: - Usage API
@@ -1028,7 +1047,7 @@ class DianeClient: DianeClientProtocol {
         }
         
         let data = try await request(path)
-        return try makeGoCompatibleDecoder().decode(UsageResponse.self, from: data)
+        return try Self.goDecoder.decode(UsageResponse.self, from: data)
     }
     
     /// Get usage summary (aggregated by provider/model)
@@ -1051,7 +1070,7 @@ class DianeClient: DianeClientProtocol {
         }
         
         let data = try await request(path)
-        return try makeGoCompatibleDecoder().decode(UsageSummaryResponse.self, from: data)
+        return try Self.goDecoder.decode(UsageSummaryResponse.self, from: data)
     }
     
     // MARK: - Google OAuth API
@@ -1059,38 +1078,42 @@ class DianeClient: DianeClientProtocol {
     /// Get Google authentication status
     func getGoogleAuthStatus(account: String = "default") async throws -> GoogleAuthStatus {
         let data = try await request("/google/auth?account=\(account)")
-        return try JSONDecoder().decode(GoogleAuthStatus.self, from: data)
+        return try Self.jsonDecoder.decode(GoogleAuthStatus.self, from: data)
     }
     
     /// Start Google OAuth device flow
     func startGoogleAuth(account: String? = nil, scopes: [String]? = nil) async throws -> GoogleDeviceCodeResponse {
-        var body: [String: Any] = [:]
-        if let account = account {
-            body["account"] = account
-        }
-        if let scopes = scopes {
-            body["scopes"] = scopes
+        struct Body: Encodable {
+            let account: String?
+            let scopes: [String]?
         }
-        
-        let bodyData = body.isEmpty ? nil : try JSONSerialization.data(withJSONObject: body)
+        let bodyData = (account == nil && scopes == nil)
+            ? nil
+            : try Self.jsonEncoder.encode(Body(account: account, scopes: scopes))
         let data = try await request("/google/auth/start", method: "POST", timeout: 10, body: bodyData)
-        return try JSONDecoder().decode(GoogleDeviceCodeResponse.self, from: data)
+        return try Self.jsonDecoder.decode(GoogleDeviceCodeResponse.self, from: data)
     }
     
     /// Poll for Google OAuth token
     /// Returns the poll response. Check isPending, isSuccess, etc. to determine status.
     func pollGoogleAuth(account: String = "default", deviceCode: String, interval: Int) async throws -> GoogleAuthPollResponse {
-        let body: [String: Any] = [
-            "account": account,
-            "device_code": deviceCode,
-            "interval": interval
-        ]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        struct Body: Encodable {
+            let account: String
+            let deviceCode: String
+            let interval: Int
+
+            enum CodingKeys: String, CodingKey {
+                case account
+                case deviceCode = "device_code"
+                case interval
+            }
+        }
+        let bodyData = try Self.jsonEncoder.encode(Body(account: account, deviceCode: deviceCode, interval: interval))
         
         // This endpoint may return 202 (pending), 429 (slow down), 410 (expired), 403 (denied), or 200 (success)
         // We need to handle non-200 status codes specially
         let data = try await requestWithStatus("/google/auth/poll", method: "POST", timeout: 30, body: bodyData)
-        return try makeGoCompatibleDecoder().decode(GoogleAuthPollResponse.self, from: data)
+        return try Self.goDecoder.decode(GoogleAuthPollResponse.self, from: data)
     }
     
     /// Delete Google OAuth token
@@ -1103,7 +1126,7 @@ class DianeClient: DianeClientProtocol {
     /// Get all registered slaves
     func getSlaves() async throws -> [SlaveInfo] {
         let data = try await request("/slaves", timeout: 5)
-        return try JSONDecoder().decode([SlaveInfo].self, from: data)
+        return try Self.jsonDecoder.decode([SlaveInfo].self, from: data)
     }
     
     /// Get pending pairing requests
@@ -1113,36 +1136,30 @@ class DianeClient: DianeClientProtocol {
         if let str = String(data: data, encoding: .utf8) {
             logger.info("DEBUG: Response from /slaves/pending: \(str)")
         }
-        return try JSONDecoder().decode([PairingRequest].self, from: data)
+        return try Self.jsonDecoder.decode([PairingRequest].self, from: data)
     }
     
     /// Approve a pairing request
     func approvePairingRequest(hostname: String, pairingCode: String) async throws {
-        let body: [String: Any] = [
-            "hostname": hostname,
-            "pairing_code": pairingCode
-        ]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let body = ["hostname": hostname, "pairing_code": pairingCode]
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await request("/slaves/approve", method: "POST", timeout: 10, body: bodyData)
     }
     
     /// Deny a pairing request
     func denyPairingRequest(hostname: String, pairingCode: String) async throws {
-        let body: [String: Any] = [
-            "hostname": hostname,
-            "pairing_code": pairingCode
-        ]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let body = ["hostname": hostname, "pairing_code": pairingCode]
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await request("/slaves/deny", method: "POST", timeout: 10, body: bodyData)
     }
     
     /// Revoke slave credentials
     func revokeSlaveCredentials(hostname: String, reason: String?) async throws {
-        var body: [String: Any] = ["hostname": hostname]
-        if let reason = reason {
-            body["reason"] = reason
+        struct Body: Encodable {
+            let hostname: String
+            let reason: String?
         }
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let bodyData = try Self.jsonEncoder.encode(Body(hostname: hostname, reason: reason))
         _ = try await request("/slaves/revoke", method: "POST", timeout: 10, body: bodyData)
     }
     
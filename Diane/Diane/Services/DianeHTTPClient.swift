@@ -67,6 +67,17 @@ class DianeHTTPClient: DianeClientProtocol {
     private(set) var apiKey: String?
     private let session: URLSession
 
+    /// Shared coders — building JSONEncoder/JSONDecoder per request is wasted
+    /// allocation on the hot path, so create them once and reuse
+    private static let jsonEncoder = JSONEncoder()
+    private static let jsonDecoder = JSONDecoder()
+    private static let goDecoder = makeGoCompatibleDecoderHTTP()
+
+    /// CharacterSet.urlPathAllowed/.urlQueryAllowed are computed properties
+    /// that can construct a bridged NSCharacterSet on each access; cache them
+    private static let pathAllowed: CharacterSet = .urlPathAllowed
+    private static let queryAllowed: CharacterSet = .urlQueryAllowed
+
     init(baseURL: URL, apiKey: String? = nil) {
         self.baseURL = baseURL
         self.apiKey = apiKey
@@ -180,7 +191,7 @@ class DianeHTTPClient: DianeClientProtocol {
     /// Decode data using the Go-compatible decoder, wrapping errors
     private func decodeGo<T: Decodable>(_ type: T.Type, from data: Data) throws -> T {
         do {
-            return try makeGoCompatibleDecoderHTTP().decode(type, from: data)
+            return try Self.goDecoder.decode(type, from: data)
         } catch {
             throw DianeHTTPClientError.decodingFailed(underlying: error)
         }
@@ -189,7 +200,7 @@ class DianeHTTPClient: DianeClientProtocol {
     /// Decode data using a plain JSONDecoder, wrapping errors
     private func decode<T: Decodable>(_ type: T.Type, from data: Data) throws -> T {
         do {
-            return try JSONDecoder().decode(type, from: data)
+            return try Self.jsonDecoder.decode(type, from: data)
         } catch {
             throw DianeHTTPClientError.decodingFailed(underlying: error)
         }
@@ -277,7 +288,7 @@ class DianeHTTPClient: DianeClientProtocol {
     // MARK: - MCP Placements
     
     func getPlacements(hostID: String) async throws -> [MCPServerPlacement] {
-        guard let encodedHostID = hostID.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) else {
+        guard let encodedHostID = hostID.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) else {
             throw DianeHTTPClientError.invalidURL(path: hostID)
         }
         let data = try await request("/mcp-placements?host_id=\(encodedHostID)")
@@ -285,19 +296,19 @@ class DianeHTTPClient: DianeClientProtocol {
     }
     
     func updatePlacement(serverID: Int64, hostID: String, enabled: Bool) async throws -> MCPServerPlacement {
-        guard let encodedHostID = hostID.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) else {
+        guard let encodedHostID = hostID.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) else {
             throw DianeHTTPClientError.invalidURL(path: hostID)
         }
         
         let body = UpdatePlacementRequest(enabled: enabled)
-        let bodyData = try JSONEncoder().encode(body)
+        let bodyData = try Self.jsonEncoder.encode(body)
         
         let data = try await requestWithBody("/mcp-placements/\(serverID)/\(encodedHostID)", method: "PUT", body: bodyData)
         return try decodeGo(MCPServerPlacement.self, from: data)
     }
     
     func deletePlacement(serverID: Int64, hostID: String) async throws {
-        guard let encodedHostID = hostID.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) else {
+        guard let encodedHostID = hostID.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) else {
             throw DianeHTTPClientError.invalidURL(path: hostID)
         }
         _ = try await requestWithBody("/mcp-placements/\(serverID)/\(encodedHostID)", method: "DELETE")
@@ -328,15 +339,15 @@ class DianeHTTPClient: DianeClientProtocol {
     }
     
     func getPromptContent(server: String, name: String) async throws -> PromptContentResponse {
-        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? server
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? name
+        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? server
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? name
         let data = try await request("/prompts/get?server=\(encodedServer)&name=\(encodedName)")
         return try decode(PromptContentResponse.self, from: data)
     }
     
     func getResourceContent(server: String, uri: String) async throws -> ResourceContentResponse {
-        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? server
-        let encodedURI = uri.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? uri
+        let encodedServer = server.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? server
+        let encodedURI = uri.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? uri
         let data = try await request("/resources/read?server=\(encodedServer)&uri=\(encodedURI)")
         return try decode(ResourceContentResponse.self, from: data)
     }
@@ -361,7 +372,7 @@ class DianeHTTPClient: DianeClientProtocol {
     func getJobLogs(jobName: String?, limit: Int) async throws -> [JobExecution] {
         var path = "/jobs/logs?limit=\(limit)"
         if let jobName = jobName {
-            let encoded = jobName.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? jobName
+            let encoded = jobName.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? jobName
             path += "&job_name=\(encoded)"
         }
         let data = try await request(path)
@@ -374,8 +385,18 @@ class DianeHTTPClient: DianeClientProtocol {
 
     // MARK: - Agents
 
+    /// Build a percent-encoded /agents/... path. URLComponents uses
+    /// CoreFoundation's encoder and gives one consistent escape policy instead
+    /// of a per-call addingPercentEncoding whose `?? name` fallback could emit
+    /// an unencoded path.
+    private static func agentPath(_ name: String, suffix: String = "") -> String {
+        var components = URLComponents()
+        components.path = "/agents/\(name)\(suffix)"
+        return components.percentEncodedPath
+    }
+
     func addAgent(agent: AgentConfig) async throws {
-        let bodyData = try JSONEncoder().encode(agent)
+        let bodyData = try Self.jsonEncoder.encode(agent)
         _ = try await requestWithBody("/agents", method: "POST", body: bodyData)
     }
 
@@ -385,39 +406,35 @@ class DianeHTTPClient: DianeClientProtocol {
     }
 
     func getAgent(name: String) async throws -> AgentConfig {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        let data = try await request("/agents/\(encodedName)")
+        let data = try await request(Self.agentPath(name))
         return try decode(AgentConfig.self, from: data)
     }
 
     func testAgent(name: String) async throws -> AgentTestResult {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        let data = try await requestWithBody("/agents/\(encodedName)/test", method: "POST", body: nil)
+        let data = try await requestWithBody(Self.agentPath(name, suffix: "/test"), method: "POST", body: nil)
         return try decode(AgentTestResult.self, from: data)
     }
 
     func toggleAgent(name: String, enabled: Bool) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
         let body = ["enabled": enabled]
-        let bodyData = try JSONEncoder().encode(body)
-        _ = try await requestWithBody("/agents/\(encodedName)/toggle", method: "POST", body: bodyData)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        _ = try await requestWithBody(Self.agentPath(name, suffix: "/toggle"), method: "POST", body: bodyData)
     }
 
     func runAgentPrompt(agentName: String, prompt: String, remoteAgentName: String?) async throws -> AgentRunResult {
-        let encodedName = agentName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentName
         var body: [String: String] = ["prompt": prompt]
         if let remoteAgent = remoteAgentName {
             body["agent_name"] = remoteAgent
         }
-        let bodyData = try JSONEncoder().encode(body)
-        let data = try await requestWithBody("/agents/\(encodedName)/run", method: "POST", body: bodyData)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        let data = try await requestWithBody(Self.agentPath(agentName, suffix: "/run"), method: "POST", body: bodyData)
         return try decodeGo(AgentRunResult.self, from: data)
     }
 
     func getAgentLogs(agentName: String?, limit: Int) async throws -> [AgentLog] {
         var path = "/agents/logs?limit=\(limit)"
         if let agentName = agentName {
-            let encoded = agentName.addingPercentEncoding(withAllowedCharacters: .urlQueryAllowed) ?? agentName
+            let encoded = agentName.addingPercentEncoding(withAllowedCharacters: Self.queryAllowed) ?? agentName
             path += "&agent_name=\(encoded)"
         }
         let data = try await request(path)
@@ -425,35 +442,33 @@ class DianeHTTPClient: DianeClientProtocol {
     }
 
     func removeAgent(name: String) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        _ = try await requestWithBody("/agents/\(encodedName)", method: "DELETE")
+        _ = try await requestWithBody(Self.agentPath(name), method: "DELETE")
     }
 
     func getRemoteAgents(agentName: String) async throws -> [RemoteAgentInfo] {
-        let encodedName = agentName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentName
-        let data = try await request("/agents/\(encodedName)/remote-agents")
+        let data = try await request(Self.agentPath(agentName, suffix: "/remote-agents"))
         return try decode([RemoteAgentInfo].self, from: data)
     }
 
     func updateAgent(name: String, subAgent: String?, enabled: Bool?, description: String?, workdir: String?) async throws {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
-        var body: [String: Any] = [:]
-        if let subAgent = subAgent {
-            body["sub_agent"] = subAgent
-        }
-        if let enabled = enabled {
-            body["enabled"] = enabled
-        }
-        if let description = description {
-            body["description"] = description
-        }
-        if let workdir = workdir {
-            body["workdir"] = workdir
+        struct Body: Encodable {
+            let subAgent: String?
+            let enabled: Bool?
+            let description: String?
+            let workdir: String?
+
+            enum CodingKeys: String, CodingKey {
+                case subAgent = "sub_agent"
+                case enabled, description, workdir
+            }
         }
-        
-        guard !body.isEmpty else { return }
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
-        _ = try await requestWithBody("/agents/\(encodedName)/update", method: "POST", body: bodyData)
+
+        // Nothing to update — keep the old no-op behavior
+        guard subAgent != nil || enabled != nil || description != nil || workdir != nil else { return }
+
+        let body = Body(subAgent: subAgent, enabled: enabled, description: description, workdir: workdir)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        _ = try await requestWithBody(Self.agentPath(name, suffix: "/update"), method: "POST", body: bodyData)
     }
 
     // MARK: - Gallery (read-only: no install)
@@ -471,34 +486,28 @@ class DianeHTTPClient: DianeClientProtocol {
     // MARK: - Cloud Agent Methods
     
     func triggerRun(agentId: String) async throws -> EmergentTriggerResponseDTO {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let data = try await requestWithBody("/agents/\(encodedId)/trigger", method: "POST")
+        let data = try await requestWithBody(Self.agentPath(agentId, suffix: "/trigger"), method: "POST")
         return try decodeGo(EmergentTriggerResponseDTO.self, from: data)
     }
 
     func getAgentRuns(agentId: String, limit: Int = 10) async throws -> [EmergentAgentRunDTO] {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let data = try await request("/agents/\(encodedId)/runs?limit=\(limit)")
+        let data = try await request(Self.agentPath(agentId, suffix: "/runs") + "?limit=\(limit)")
         return try decodeGo([EmergentAgentRunDTO].self, from: data)
     }
 
     func cancelRun(agentId: String, runId: String) async throws {
-        let encodedAgent = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let encodedRun = runId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? runId
-        _ = try await requestWithBody("/agents/\(encodedAgent)/runs/\(encodedRun)/cancel", method: "POST")
+        _ = try await requestWithBody(Self.agentPath(agentId, suffix: "/runs/\(runId)/cancel"), method: "POST")
     }
 
     func getPendingEvents(agentId: String, limit: Int = 100) async throws -> EmergentPendingEventsResponseDTO {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
-        let data = try await request("/agents/\(encodedId)/pending-events?limit=\(limit)")
+        let data = try await request(Self.agentPath(agentId, suffix: "/pending-events") + "?limit=\(limit)")
         return try decodeGo(EmergentPendingEventsResponseDTO.self, from: data)
     }
 
     func batchTrigger(agentId: String, objectIds: [String]) async throws -> EmergentBatchTriggerResponseDTO {
-        let encodedId = agentId.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? agentId
         let body = ["objectIds": objectIds]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
-        let data = try await requestWithBody("/agents/\(encodedId)/batch-trigger", method: "POST", body: bodyData)
+        let bodyData = try Self.jsonEncoder.encode(body)
+        let data = try await requestWithBody(Self.agentPath(agentId, suffix: "/batch-trigger"), method: "POST", body: bodyData)
         return try decodeGo(EmergentBatchTriggerResponseDTO.self, from: data)
     }
 
@@ -514,7 +523,7 @@ class DianeHTTPClient: DianeClientProtocol {
     }
 
     func getContextDetail(name: String) async throws -> ContextDetail {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? name
         let data = try await request("/contexts/\(encodedName)")
         return try decode(ContextDetail.self, from: data)
     }
@@ -536,13 +545,13 @@ class DianeHTTPClient: DianeClientProtocol {
     }
 
     func getContextConnectInfo(name: String) async throws -> ContextConnectInfo {
-        let encodedName = name.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? name
+        let encodedName = name.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? name
         let data = try await request("/contexts/\(encodedName)/connect")
         return try decode(ContextConnectInfo.self, from: data)
     }
 
     func getContextServers(contextName: String) async throws -> [ContextServer] {
-        let encodedName = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
+        let encodedName = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
         let data = try await request("/contexts/\(encodedName)/servers")
         return try decode([ContextServer].self, from: data)
     }
@@ -556,8 +565,8 @@ class DianeHTTPClient: DianeClientProtocol {
     }
 
     func getContextServerTools(contextName: String, serverName: String) async throws -> [ContextTool] {
-        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
-        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? serverName
+        let encodedContext = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
+        let encodedServer = serverName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? serverName
         let data = try await request("/contexts/\(encodedContext)/servers/\(encodedServer)/tools")
         return try decode([ContextTool].self, from: data)
     }
@@ -575,7 +584,7 @@ class DianeHTTPClient: DianeClientProtocol {
     }
 
     func getAvailableServers(contextName: String) async throws -> [AvailableServer] {
-        let encodedName = contextName.addingPercentEncoding(withAllowedCharacters: .urlPathAllowed) ?? contextName
+        let encodedName = contextName.addingPercentEncoding(withAllowedCharacters: Self.pathAllowed) ?? contextName
         let data = try await request("/contexts/\(encodedName)/available-servers")
         return try decodeGo([AvailableServer].self, from: data)
     }
@@ -712,38 +721,32 @@ class DianeHTTPClient: DianeClientProtocol {
     
     func getSlaves() async throws -> [SlaveInfo] {
         let data = try await request("/slaves")
-        return try JSONDecoder().decode([SlaveInfo].self, from: data)
+        return try Self.jsonDecoder.decode([SlaveInfo].self, from: data)
     }
     
     func getPendingPairingRequests() async throws -> [PairingRequest] {
         let data = try await request("/slaves/pending")
-        return try JSONDecoder().decode([PairingRequest].self, from: data)
+        return try Self.jsonDecoder.decode([PairingRequest].self, from: data)
     }
     
     func approvePairingRequest(hostname: String, pairingCode: String) async throws {
-        let body: [String: Any] = [
-            "hostname": hostname,
-            "pairing_code": pairingCode
-        ]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let body = ["hostname": hostname, "pairing_code": pairingCode]
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await requestWithBody("/slaves/approve", method: "POST", body: bodyData)
     }
     
     func denyPairingRequest(hostname: String, pairingCode: String) async throws {
-        let body: [String: Any] = [
-            "hostname": hostname,
-            "pairing_code": pairingCode
-        ]
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let body = ["hostname": hostname, "pairing_code": pairingCode]
+        let bodyData = try Self.jsonEncoder.encode(body)
         _ = try await requestWithBody("/slaves/deny", method: "POST", body: bodyData)
     }
     
     func revokeSlaveCredentials(hostname: String, reason: String?) async throws {
-        var body: [String: Any] = ["hostname": hostname]
-        if let reason = reason {
-            body["reason"] = reason
+        struct Body: Encodable {
+            let hostname: String
+            let reason: String?
         }
-        let bodyData = try JSONSerialization.data(withJSONObject: body)
+        let bodyData = try Self.jsonEncoder.encode(Body(hostname: hostname, reason: reason))
         _ = try await requestWithBody("/slaves/revoke", method: "POST", body: bodyData)
     }
     